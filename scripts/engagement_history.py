@@ -0,0 +1,133 @@
+"""Delta-encoded per-post engagement time series (data/engagement-history.json).
+
+Each post keeps its first observation plus one [dt_s, d_comments, d_upvotes]
+sample per refresh in which a counter actually moved, so the store grows with
+engagement changes rather than with the number of runs. A post's samples are
+kept for as long as the post is; posts missing from the feed for RETENTION_S
+are pruned.
+
+Velocity is the growth over the trailing VELOCITY_WINDOW_S ending at the refresh,
+per hour. Counters are treated as a step function (a change counts from the
+refresh that observed it), so the count at the window start is the newest sample
+at or before it. A cursor tracks that sample and only moves forward, so keeping
+velocity current costs O(1) amortized per post, changed or idle.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from datetime import datetime, timezone
+
+HISTORY_PATH = pathlib.Path(__file__).resolve().parents[1] / "data" / "engagement-history.json"
+HISTORY_VERSION = 1
+VELOCITY_WINDOW_S = 24 * 3600
+RETENTION_S = 30 * 24 * 3600
+CURVE_POINTS = 24
+
+
+def load_history(path: pathlib.Path = HISTORY_PATH) -> dict:
+    """Load the store; refuse to continue rather than overwrite a file we can't read."""
+    try:
+        history = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {"version": HISTORY_VERSION, "posts": {}}
+    except json.JSONDecodeError as err:
+        raise SystemExit(f"{path} is not valid JSON ({err}); restore or remove it to start a new history")
+    if not isinstance(history, dict) or history.get("version") != HISTORY_VERSION:
+        found = history.get("version") if isinstance(history, dict) else None
+        raise SystemExit(f"{path} has version {found!r}, expected {HISTORY_VERSION}; restore or remove it")
+    return history
+
+
+def save_history(history: dict, path: pathlib.Path = HISTORY_PATH) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(history, separators=(",", ":")) + "\n")
+    tmp.replace(path)
+
+
+def _update_velocity(series: dict, t_now: int) -> None:
+    """Slide the window cursor to ``t_now - VELOCITY_WINDOW_S`` and refresh velocity."""
+    boundary = t_now - VELOCITY_WINDOW_S
+    cursor = series["window"]
+    deltas = series["deltas"]
+    while cursor[3] < len(deltas):
+        dt, dc, du = deltas[cursor[3]]
+        if cursor[0] + dt > boundary:
+            break
+        cursor[0] += dt
+        cursor[1] += dc
+        cursor[2] += du
+        cursor[3] += 1
+    # A post first seen inside the window only has growth since then.
+    span_s = min(VELOCITY_WINDOW_S, t_now - series["base"][0])
+    hours = span_s / 3600
+    _, c_last, u_last = series["last"]
+    series["velocity"] = {
+        "comments_per_hour": round((c_last - cursor[1]) / hours, 2) if hours else 0.0,
+        "upvotes_per_hour": round((u_last - cursor[2]) / hours, 2) if hours else 0.0,
+        "as_of": t_now,
+    }
+
+
+def record(history: dict, posts: list[dict], now: datetime | None = None) -> list[str]:
+    """Sample ``posts`` into ``history``; return the ids whose counters moved.
+
+    Every post passed in gets its velocity brought up to ``now``; only changed
+    posts get a new sample.
+    """
+    t = int((now or datetime.now(timezone.utc)).timestamp())
+    store = history["posts"]
+    changed = []
+    for post in posts:
+        post_id = post.get("id")
+        if not post_id:
+            continue
+        comments = post.get("comment_count", 0) or 0
+        upvotes = post.get("upvotes", 0) or 0
+        series = store.get(post_id)
+        if series is None:
+            store[post_id] = series = {
+                "base": [t, comments, upvotes],
+                "deltas": [],
+                "last": [t, comments, upvotes],
+                # [t, comments, upvotes, next delta index] at the window start
+                "window": [t, comments, upvotes, 0],
+            }
+            changed.append(post_id)
+        else:
+            t_prev, c_prev, u_prev = series["last"]
+            if comments != c_prev or upvotes != u_prev:
+                series["deltas"].append([t - t_prev, comments - c_prev, upvotes - u_prev])
+                series["last"] = [t, comments, upvotes]
+                changed.append(post_id)
+        series["seen"] = t
+        _update_velocity(series, t)
+
+    for post_id in [k for k, s in store.items() if s.get("seen", s["last"][0]) < t - RETENTION_S]:
+        del store[post_id]
+    return changed
+
+
+def growth_curve(series: dict, points: int = CURVE_POINTS) -> list[list]:
+    """Decode the newest ``points`` samples as [timestamp, comments, upvotes]."""
+    t, c, u = series["last"]
+    curve = [[t, c, u]]
+    for dt, dc, du in reversed(series["deltas"][-(points - 1):] if points > 1 else []):
+        t, c, u = t - dt, c - dc, u - du
+        curve.append([t, c, u])
+    curve.reverse()
+    return [
+        [datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z"), cc, uu]
+        for ts, cc, uu in curve
+    ]
+
+
+def velocity(series: dict) -> dict:
+    v = series.get("velocity") or {"comments_per_hour": 0.0, "upvotes_per_hour": 0.0, "as_of": series["last"][0]}
+    return {
+        "comments_per_hour": v["comments_per_hour"],
+        "upvotes_per_hour": v["upvotes_per_hour"],
+        "window_hours": VELOCITY_WINDOW_S // 3600,
+        "as_of": datetime.fromtimestamp(v["as_of"], tz=timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
@@ -0,0 +1,60 @@
+"""Freshness hints stamped onto data/*.json so the pages know when to poll again.
+
+Some files have more than one writer (status.json, receipts.json, cost.json,
+tokens.json), so each writer records its own slot under ``sources``; the pages
+schedule from the earliest slot that is still upcoming. The top-level
+``next_update_at`` is that same earliest upcoming slot as of ``generated_at``.
+
+Writers resolve their cadence once at import via ``cadence()``, which honours a
+``<WRITER>_CADENCE_S`` override (e.g. UPDATE_ENGAGEMENT_CADENCE_S=900) and ignores
+invalid values with a warning.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Heartbeat entries in data/backlog.json land roughly hourly.
+HEARTBEAT_CADENCE_S = 3600
+
+
+def iso(dt: datetime) -> str:
+    return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def cadence(source: str, default_s: int) -> int:
+    env = f"{source.upper()}_CADENCE_S"
+    raw = os.getenv(env)
+    if raw is None:
+        return default_s
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value > 0:
+        return value
+    print(f"Warning: ignoring {env}={raw!r}; using {default_s}s", file=sys.stderr)
+    return default_s
+
+
+def freshness(source: str, cadence_s: int, previous: dict | None = None,
+              generated_at: datetime | None = None) -> dict:
+    """Return the ``freshness`` block, merged with the one already in the file."""
+    generated_at = generated_at or datetime.now(timezone.utc)
+    sources = dict((previous or {}).get("sources") or {})
+    sources[source] = {
+        "generated_at": iso(generated_at),
+        "next_update_at": iso(generated_at + timedelta(seconds=cadence_s)),
+        "cadence_s": cadence_s,
+    }
+    # Overdue writers drop out; this writer's own slot is always upcoming.
+    now = iso(generated_at)
+    upcoming = [s for s in sources.values() if s.get("next_update_at", "") > now]
+    nearest = min(upcoming, key=lambda s: s["next_update_at"])
+    return {
+        "generated_at": now,
+        "next_update_at": nearest["next_update_at"],
+        "sources": sources,
+    }
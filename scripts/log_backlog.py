@@ -12,8 +12,11 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+
 ROOT = Path(__file__).resolve().parents[1]
 BACKLOG_PATH = ROOT / "data" / "backlog.json"
+CADENCE_S = cadence("log_backlog", HEARTBEAT_CADENCE_S)
 
 
 def load() -> dict:
@@ -39,6 +42,7 @@ def main() -> None:
         "notes": args.note
     }
     history.append(entry)
+    data["freshness"] = freshness("log_backlog", CADENCE_S, data.get("freshness"))
     BACKLOG_PATH.write_text(json.dumps(data, indent=2) + "\n")
     print(f"Logged backlog entry: {entry}")
 
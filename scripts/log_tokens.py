@@ -12,8 +12,11 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+
 ROOT = Path(__file__).resolve().parents[1]
 TOKENS_PATH = ROOT / "data" / "tokens.json"
+CADENCE_S = cadence("log_tokens", HEARTBEAT_CADENCE_S)
 
 
 def load() -> dict:
@@ -47,6 +50,7 @@ def main() -> None:
         entry["deltaOut"] = args.tokens_out
 
     entries.append(entry)
+    data["freshness"] = freshness("log_tokens", CADENCE_S, data.get("freshness"))
     TOKENS_PATH.write_text(json.dumps(data, indent=2) + "\n")
     print(f"Logged tokens: {entry}")
 
@@ -8,8 +8,12 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+from freshness import cadence, freshness
+
 ROOT = Path(__file__).resolve().parents[1]
 OUTPUT_PATH = ROOT / "data" / "usage.json"
+# Assumed daily: usage-cost rolls up per day; override with METER_OPENAI_USAGE_CADENCE_S
+CADENCE_S = cadence("meter_openai_usage", 86400)
 
 
 def fetch_gateway_usage(days: int = 31) -> dict:
@@ -40,6 +44,7 @@ def main() -> None:
             }
             for entry in payload.get("daily", [])
         ],
+        "freshness": freshness("meter_openai_usage", CADENCE_S),
     }
 
     OUTPUT_PATH.write_text(json.dumps(usage, indent=2) + "\n")
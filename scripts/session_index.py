@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""Byte-offset index over OpenClaw session logs for per-session / time-range drilldown.
+
+Usage:
+    ./scripts/session_index.py                                # refresh index, print totals
+    ./scripts/session_index.py --session 3f2a...              # one session's cost
+    ./scripts/session_index.py --since 2026-02-10T14:00 --until 2026-02-10T15:00 --lines
+    ./scripts/session_index.py --model claude-opus-4-6 --rebuild
+
+The index lives next to the logs in sessions/.signal-index/ (or wherever
+SESSION_INDEX_DIR / --index-dir points, e.g. when the sessions dir is read-only):
+
+- meta.json holds one small record per *.jsonl file: bytes already indexed, inode and
+  head hash (to spot rotation), ts range, and running cost totals. update_cost.py only
+  reads this, so its memory and work scale with the number of log files.
+- <log>.rows is append-only JSONL with one [offset, ts_ms, model, cost] row per
+  billed turn. Drilldowns load only the row files they need (bisecting on ts when
+  the rows arrived in order) and seek into the logs through an mmap.
+
+Lines without a numeric usage.cost.total are not indexed, so drilldowns list billed
+turns, not every log line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+from datetime import datetime, timezone
+
+SESSIONS_DIR = pathlib.Path.home() / ".openclaw/agents/main/sessions"
+INDEX_DIRNAME = ".signal-index"
+INDEX_VERSION = 1
+HEAD_BYTES = 256  # prefix hashed to detect a log replaced in place
+
+# Row layout inside <log>.rows
+OFFSET, TS, MODEL, COST = range(4)
+
+
+def parse_ts(value) -> int | None:
+    """Return epoch milliseconds for an ISO string or epoch number, else None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        # Session logs mix epoch-ms message stamps with ISO entry stamps.
+        return int(value if value > 1e11 else value * 1000)
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def fmt_ts(ms: int | None) -> str:
+    if ms is None:
+        return "?"
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def index_line(offset: int, raw: bytes) -> list | None:
+    """Return a row for a billed turn, or None for anything else."""
+    try:
+        d = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(d, dict):
+        return None
+    msg = d.get("message", {})
+    if not isinstance(msg, dict):
+        return None
+    usage = msg.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    c = usage.get("cost", {})
+    if not isinstance(c, dict):
+        return None
+    cost = c.get("total")
+    if not isinstance(cost, (int, float)) or isinstance(cost, bool):
+        return None
+    ts = parse_ts(d.get("timestamp")) or parse_ts(msg.get("timestamp"))
+    model = msg.get("model") or "unknown"
+    return [offset, ts, model, cost]
+
+
+def empty_entry(ino: int) -> dict:
+    return {
+        "size": 0,
+        "ino": ino,
+        "head": None,
+        "rows_bytes": 0,
+        "sorted": True,
+        "first_ts": None,
+        "last_ts": None,
+        "turns": 0,
+        "total": 0,
+        "by_model": {},
+    }
+
+
+def load_meta(index_dir: pathlib.Path) -> dict:
+    try:
+        meta = json.loads((index_dir / "meta.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"version": INDEX_VERSION, "files": {}}
+    if meta.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "files": {}}
+    return meta
+
+
+def save_meta(meta: dict, index_dir: pathlib.Path) -> None:
+    tmp = index_dir / "meta.tmp"
+    tmp.write_text(json.dumps(meta, separators=(",", ":")))
+    tmp.replace(index_dir / "meta.json")
+
+
+def head_hash(mm, size: int) -> str:
+    return hashlib.sha1(mm[:min(size, HEAD_BYTES)]).hexdigest()
+
+
+def refresh_file(path: pathlib.Path, entry: dict | None, rows_path: pathlib.Path) -> dict:
+    """Index bytes appended to ``path`` since ``entry`` was written."""
+    st = path.stat()
+    size = st.st_size
+    if entry is not None and (entry["ino"] != st.st_ino or size < entry["size"]):
+        entry = None  # rotated, replaced or truncated underneath us
+    if entry is not None and entry["head"] and size:
+        with open(path, "rb") as fh:
+            prefix = fh.read(min(entry["size"], HEAD_BYTES))
+        if hashlib.sha1(prefix).hexdigest() != entry["head"]:
+            entry = None
+    if entry is None:
+        entry = empty_entry(st.st_ino)
+    start = entry["size"]
+    if size == start:
+        return entry
+
+    new_rows = []
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Only consume complete lines; a partially flushed tail is picked up next run
+        # unless it already parses (final line written without a trailing newline).
+        end = mm.rfind(b"\n", start, size) + 1
+        if end < size and json_complete(mm[max(end, start):size]):
+            end = size
+        if end <= start:
+            return entry
+        pos = start
+        while pos < end:
+            nl = mm.find(b"\n", pos, end)
+            if nl == -1:
+                nl = end
+            row = index_line(pos, mm[pos:nl])
+            if row is not None:
+                new_rows.append(row)
+            pos = nl + 1
+        if entry["head"] is None or start < HEAD_BYTES:
+            entry["head"] = head_hash(mm, end)
+
+    for row in new_rows:
+        ts = row[TS]
+        if ts is None or (entry["last_ts"] is not None and ts < entry["last_ts"]):
+            entry["sorted"] = False
+        if ts is not None:
+            if entry["first_ts"] is None or ts < entry["first_ts"]:
+                entry["first_ts"] = ts
+            if entry["last_ts"] is None or ts > entry["last_ts"]:
+                entry["last_ts"] = ts
+        entry["turns"] += 1
+        entry["total"] += row[COST]
+        entry["by_model"][row[MODEL]] = entry["by_model"].get(row[MODEL], 0) + row[COST]
+
+    # Drop any rows a crashed run appended past what meta.json recorded.
+    keep = entry["rows_bytes"] if start else 0
+    with open(rows_path, "ab") as out:
+        out.truncate(keep)
+        out.seek(keep)
+        out.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in new_rows).encode())
+        entry["rows_bytes"] = out.tell()
+    entry["size"] = end
+    return entry
+
+
+def json_complete(raw: bytes) -> bool:
+    try:
+        json.loads(raw)
+    except ValueError:
+        return False
+    return True
+
+
+def default_index_dir(sessions_dir: pathlib.Path) -> pathlib.Path:
+    env = os.getenv("SESSION_INDEX_DIR")
+    return pathlib.Path(env).expanduser() if env else sessions_dir / INDEX_DIRNAME
+
+
+def update_index(sessions_dir: pathlib.Path = SESSIONS_DIR, rebuild: bool = False,
+                 index_dir: pathlib.Path | None = None) -> dict:
+    """Bring the sidecar index up to date with ``sessions_dir`` and persist it."""
+    index_dir = index_dir or default_index_dir(sessions_dir)
+    meta = {"version": INDEX_VERSION, "files": {}} if rebuild else load_meta(index_dir)
+    if not sessions_dir.exists():
+        return meta
+    index_dir.mkdir(parents=True, exist_ok=True)
+    files = meta["files"]
+    seen = set()
+    changed = rebuild
+
+    for path in sorted(sessions_dir.glob("*.jsonl")):
+        seen.add(path.name)
+        before = files.get(path.name)
+        before_key = (before["ino"], before["size"]) if before else None
+        files[path.name] = refresh_file(path, None if rebuild else before, index_dir / f"{path.name}.rows")
+        if (files[path.name]["ino"], files[path.name]["size"]) != before_key:
+            changed = True
+
+    for name in set(files) - seen:
+        del files[name]
+        (index_dir / f"{name}.rows").unlink(missing_ok=True)
+        changed = True
+
+    if changed:
+        save_meta(meta, index_dir)
+    return meta
+
+
+def totals(meta: dict) -> tuple[float, int, dict]:
+    """Sum the per-file running totals without touching any row file."""
+    total = 0
+    turns = 0
+    by_model = {}
+    for entry in meta["files"].values():
+        total += entry["total"]
+        turns += entry["turns"]
+        for model, cost in entry["by_model"].items():
+            by_model[model] = by_model.get(model, 0) + cost
+    return total, turns, by_model
+
+
+def scan_totals(sessions_dir: pathlib.Path = SESSIONS_DIR) -> tuple[float, int, dict]:
+    """One-off full scan with no index, for when the index can't be written."""
+    total = 0
+    turns = 0
+    by_model = {}
+    for path in sorted(sessions_dir.glob("*.jsonl")):
+        with open(path, "rb") as fh:
+            for line in fh:
+                row = index_line(0, line)
+                if row is None:
+                    continue
+                total += row[COST]
+                turns += 1
+                by_model[row[MODEL]] = by_model.get(row[MODEL], 0) + row[COST]
+    return total, turns, by_model
+
+
+def load_rows(index_dir: pathlib.Path, name: str) -> list[list]:
+    rows_path = index_dir / f"{name}.rows"
+    if not rows_path.exists():
+        return []
+    return [json.loads(line) for line in rows_path.read_text().splitlines() if line]
+
+
+def select_rows(meta: dict, index_dir: pathlib.Path, session: str | None = None,
+                since: int | None = None, until: int | None = None, model: str | None = None):
+    """Yield (file name, row) pairs matching every given filter."""
+    files = meta["files"]
+    if session:
+        name = f"{session}.jsonl"
+        files = {name: files[name]} if name in files else {}
+    for name, entry in sorted(files.items()):
+        if not entry["turns"]:
+            continue
+        if since is not None and (entry["last_ts"] is None or entry["last_ts"] < since):
+            continue
+        if until is not None and (entry["first_ts"] is None or entry["first_ts"] >= until):
+            continue
+        rows = load_rows(index_dir, name)
+        if entry["sorted"]:
+            lo = bisect.bisect_left(rows, since, key=lambda r: r[TS]) if since is not None else 0
+            hi = bisect.bisect_left(rows, until, key=lambda r: r[TS]) if until is not None else len(rows)
+            rows = rows[lo:hi]
+        else:
+            rows = [
+                r for r in rows
+                if (since is None or (r[TS] is not None and r[TS] >= since))
+                and (until is None or (r[TS] is not None and r[TS] < until))
+            ]
+        for row in rows:
+            if model and row[MODEL] != model:
+                continue
+            yield name, row
+
+
+def summarize(rows) -> tuple[float, int, dict]:
+    total = 0
+    turns = 0
+    by_model = {}
+    for _, row in rows:
+        total += row[COST]
+        turns += 1
+        by_model[row[MODEL]] = by_model.get(row[MODEL], 0) + row[COST]
+    return total, turns, by_model
+
+
+def read_lines(sessions_dir: pathlib.Path, matches: list) -> None:
+    """Print the raw JSONL lines for ``matches`` by seeking to their offsets."""
+    by_file = {}
+    for name, row in matches:
+        by_file.setdefault(name, []).append(row[OFFSET])
+    for name, offsets in by_file.items():
+        with open(sessions_dir / name, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in offsets:
+                nl = mm.find(b"\n", offset)
+                if nl == -1:
+                    nl = len(mm)
+                print(f"{name}:{offset}\t{mm[offset:nl].decode('utf-8', 'replace')}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session", help="Session id (log file stem)")
+    parser.add_argument("--since", help="ISO timestamp, inclusive (naive = UTC)")
+    parser.add_argument("--until", help="ISO timestamp, exclusive (naive = UTC)")
+    parser.add_argument("--model", help="Only turns billed to this model")
+    parser.add_argument("--lines", action="store_true", help="Print the matching raw log lines")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and rescan every log")
+    parser.add_argument("--sessions-dir", type=pathlib.Path, default=SESSIONS_DIR)
+    parser.add_argument("--index-dir", type=pathlib.Path,
+                        help="Where to keep the index (default: $SESSION_INDEX_DIR or <sessions-dir>/.signal-index)")
+    args = parser.parse_args()
+    index_dir = args.index_dir or default_index_dir(args.sessions_dir)
+
+    since = parse_ts(args.since) if args.since else None
+    until = parse_ts(args.until) if args.until else None
+    if (args.since and since is None) or (args.until and until is None):
+        raise SystemExit("--since/--until must be ISO8601 timestamps")
+
+    meta = update_index(args.sessions_dir, rebuild=args.rebuild, index_dir=index_dir)
+    if not (args.session or since or until or args.model or args.lines):
+        total, turns, by_model = totals(meta)
+        matches = None
+    else:
+        matches = list(select_rows(meta, index_dir, args.session, since, until, args.model))
+        total, turns, by_model = summarize(matches)
+
+    if args.lines:
+        read_lines(args.sessions_dir, matches)
+
+    if matches is None:
+        stamps = [ts for e in meta["files"].values() for ts in (e["first_ts"], e["last_ts"]) if ts is not None]
+    else:
+        stamps = [row[TS] for _, row in matches if row[TS] is not None]
+    window = f"{fmt_ts(min(stamps))} → {fmt_ts(max(stamps))}" if stamps else "no timestamps"
+    print(f"{turns} turns | ${total:.2f} | {window}")
+    for name, cost in sorted(by_model.items(), key=lambda x: -x[1]):
+        print(f"  {name}: ${cost:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,42 +2,28 @@
 """Pull real cost data from OpenClaw session logs and update data/cost.json."""
 
 import json
-import glob
 import pathlib
+import sys
 from datetime import datetime, timezone
 
-SESSIONS_DIR = pathlib.Path.home() / ".openclaw/agents/main/sessions"
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+from session_index import scan_totals, totals, update_index
+
 COST_PATH = pathlib.Path(__file__).resolve().parents[1] / "data" / "cost.json"
+CADENCE_S = cadence("update_cost", HEARTBEAT_CADENCE_S)
 
 BUDGET_CAP = 100.00  # Feb 2026 transition month
 OPENAI_FIXED = 25.00  # GPT-5.1-codex spend (closed)
 
 
 def sum_session_costs():
-    total = 0
-    turns = 0
-    by_model = {}
-
-    for f in sorted(glob.glob(str(SESSIONS_DIR / "*.jsonl"))):
-        for line in open(f):
-            try:
-                d = json.loads(line)
-                msg = d.get("message", {})
-                if not isinstance(msg, dict):
-                    continue
-                usage = msg.get("usage")
-                if usage and isinstance(usage, dict):
-                    cost = usage.get("cost", {})
-                    if isinstance(cost, dict) and "total" in cost:
-                        t = cost["total"]
-                        total += t
-                        turns += 1
-                        model = msg.get("model", "unknown")
-                        by_model[model] = by_model.get(model, 0) + t
-            except:
-                pass
-
-    return total, turns, by_model
+    # The sidecar index keeps running totals per log; only newly appended
+    # log bytes get parsed on each run.
+    try:
+        return totals(update_index())
+    except OSError as err:
+        print(f"Warning: session index unavailable ({err}); scanning logs without it", file=sys.stderr)
+        return scan_totals()
 
 
 def main():
@@ -45,6 +31,12 @@ def main():
     grand_total = round(OPENAI_FIXED + anthropic_total, 2)
     now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
+    # update_tokens.py also writes cost.json; merge with its freshness slot
+    try:
+        previous = json.loads(COST_PATH.read_text()).get("freshness")
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = None
+
     cost_data = {
         "updated_at": now,
         "budget_cap_usd": BUDGET_CAP,
@@ -57,6 +49,7 @@ def main():
             "anthropic_opus": round(anthropic_total, 2),
         },
         "by_model": {k: round(v, 2) for k, v in sorted(by_model.items(), key=lambda x: -x[1])},
+        "freshness": freshness("update_cost", CADENCE_S, previous),
     }
 
     COST_PATH.write_text(json.dumps(cost_data, indent=2))
@@ -10,6 +10,9 @@ import urllib.error
 import urllib.request
 from datetime import datetime, timezone
 
+from engagement_history import growth_curve, load_history, record, save_history, velocity
+from freshness import cadence, freshness
+
 AGENT_NAME = os.getenv("MOLTBOOK_AGENT", "_goodKnight")
 DATA_DIR = pathlib.Path(__file__).resolve().parents[1] / "data"
 ENGAGEMENT_PATH = DATA_DIR / "engagement.json"
@@ -17,6 +20,8 @@ STATUS_PATH = DATA_DIR / "status.json"
 HOT_TOPICS_PATH = DATA_DIR / "hot-topics.json"
 PROFILE_URL = f"https://www.moltbook.com/api/v1/agents/profile?name={AGENT_NAME}"
 HOT_POSTS_URL = "https://www.moltbook.com/api/v1/posts?sort=hot&limit=50"
+# Assumed: no cron lives in this repo; override with UPDATE_ENGAGEMENT_CADENCE_S
+CADENCE_S = cadence("update_engagement", 1800)
 
 def load_api_key() -> str:
     env_key = os.getenv("MOLTBOOK_API_KEY")
@@ -62,7 +67,7 @@ def fetch_hot_posts(api_key: str) -> list[dict]:
         print(f"Warning: Could not fetch hot posts ({err.code}): {body}", file=sys.stderr)
         return []
 
-def build_payload(posts: list[dict]) -> dict:
+def build_payload(posts: list[dict], history: dict | None = None, posts_changed: int = 0) -> dict:
     def norm_ts(ts: str | None) -> str:
         if not ts:
             return ""
@@ -70,26 +75,31 @@ def build_payload(posts: list[dict]) -> dict:
 
     # Preserve existing stats (outbound comments, etc.)
     existing_stats = {}
+    existing_freshness = None
     try:
         if ENGAGEMENT_PATH.exists():
             old_data = json.loads(ENGAGEMENT_PATH.read_text())
             existing_stats = old_data.get("stats", {})
+            existing_freshness = old_data.get("freshness")
     except (json.JSONDecodeError, FileNotFoundError):
         pass
 
     entries = []
     for post in posts:
-        entries.append(
-            {
-                "id": post.get("id"),
-                "heartbeat": post.get("heartbeat"),
-                "title": post.get("title"),
-                "timestamp": norm_ts(post.get("created_at")),
-                "comments": post.get("comment_count", 0),
-                "upvotes": post.get("upvotes", 0),
-                "url": f"https://www.moltbook.com/post/{post.get('id')}" if post.get("id") else None,
-            }
-        )
+        entry = {
+            "id": post.get("id"),
+            "heartbeat": post.get("heartbeat"),
+            "title": post.get("title"),
+            "timestamp": norm_ts(post.get("created_at")),
+            "comments": post.get("comment_count", 0),
+            "upvotes": post.get("upvotes", 0),
+            "url": f"https://www.moltbook.com/post/{post.get('id')}" if post.get("id") else None,
+        }
+        series = history["posts"].get(post.get("id")) if history is not None else None
+        if series:
+            entry["growth"] = growth_curve(series)
+            entry["velocity"] = velocity(series)
+        entries.append(entry)
     entries.sort(key=lambda item: item.get("timestamp") or "")
     
     total_comments = sum(p.get("comment_count", 0) for p in posts)
@@ -103,8 +113,10 @@ def build_payload(posts: list[dict]) -> dict:
             "total_inbound_comments": total_comments,
             "total_inbound_upvotes": total_upvotes,
             "posts": len(posts),
+            "posts_changed": posts_changed,
         },
         "posts": entries,
+        "freshness": freshness("update_engagement", CADENCE_S, existing_freshness),
     }
 
 def update_status(posts: list[dict], updated_at: str) -> None:
@@ -119,6 +131,7 @@ def update_status(posts: list[dict], updated_at: str) -> None:
     status["moltPosts"] = total_posts
     status["commentCount"] = total_comments
     status["updated_at"] = updated_at
+    status["freshness"] = freshness("update_engagement", CADENCE_S, status.get("freshness"))
     STATUS_PATH.write_text(json.dumps(status, indent=2))
 
 def build_hot_topics(posts: list[dict]) -> dict:
@@ -188,6 +201,7 @@ def build_hot_topics(posts: list[dict]) -> dict:
             }
         },
         "results": entries,
+        "freshness": freshness("update_engagement", CADENCE_S),
     }
 
 def main() -> None:
@@ -196,7 +210,10 @@ def main() -> None:
     # Fetch our profile posts for engagement tracking
     profile = fetch_profile(api_key)
     our_posts = profile.get("recentPosts", [])
-    payload = build_payload(our_posts)
+    history = load_history()
+    changed = record(history, our_posts)
+    save_history(history)
+    payload = build_payload(our_posts, history, len(changed))
     ENGAGEMENT_PATH.write_text(json.dumps(payload, indent=2))
     update_status(our_posts, payload["updated_at"])
     
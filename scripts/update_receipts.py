@@ -9,10 +9,13 @@ from pathlib import Path
 
 import requests
 
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_PATH = ROOT / "data" / "receipts.json"
 CRED_PATH = Path.home() / ".config" / "moltbook" / "credentials.json"
 API_BASE = "https://www.moltbook.com/api/v1"
+CADENCE_S = cadence("update_receipts", HEARTBEAT_CADENCE_S)
 
 
 def load_credentials() -> tuple[str, str]:
@@ -64,6 +67,7 @@ def main() -> None:
         "summary": summarize(post.get("content", "")),
     }
 
+    receipts["freshness"] = freshness("update_receipts", CADENCE_S, receipts.get("freshness"))
     DATA_PATH.write_text(json.dumps(receipts, indent=2) + "\n")
     print("Updated receipts.moltbook →", receipts["moltbook"]["title"])
 
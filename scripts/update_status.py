@@ -25,9 +25,12 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+
 ROOT = Path(__file__).resolve().parents[1]
 STATUS_PATH = ROOT / "data" / "status.json"
 RECEIPTS_PATH = ROOT / "data" / "receipts.json"
+CADENCE_S = cadence("update_status", HEARTBEAT_CADENCE_S)
 
 
 def load_json(path: Path) -> dict:
@@ -97,6 +100,9 @@ def main() -> None:
     if args.x_time:
         x["timestamp"] = args.x_time
 
+    status["freshness"] = freshness("update_status", CADENCE_S, status.get("freshness"))
+    receipts["freshness"] = freshness("update_status", CADENCE_S, receipts.get("freshness"))
+
     STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
     STATUS_PATH.write_text(json.dumps(status, indent=2) + "\n")
     RECEIPTS_PATH.write_text(json.dumps(receipts, indent=2) + "\n")
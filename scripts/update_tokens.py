@@ -12,9 +12,12 @@ import pathlib
 import sys
 from datetime import datetime, timezone
 
+from freshness import HEARTBEAT_CADENCE_S, cadence, freshness
+
 DATA_DIR = pathlib.Path(__file__).resolve().parents[1] / "data"
 TOKENS_PATH = DATA_DIR / "tokens.json"
 COST_PATH = DATA_DIR / "cost.json"
+CADENCE_S = cadence("update_tokens", HEARTBEAT_CADENCE_S)
 
 # Anthropic Claude Opus pricing (per token)
 PRICE_INPUT = 15.00 / 1_000_000        # $15/M input
@@ -35,7 +38,8 @@ def main():
         cached_tokens = int(os.environ.get("ANTHROPIC_CACHED", 0))
         output_tokens = int(os.environ.get("ANTHROPIC_OUTPUT", 0))
 
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    run_at = datetime.now(timezone.utc)
+    now = run_at.isoformat().replace("+00:00", "Z")
 
     # Load existing tokens data
     try:
@@ -61,6 +65,7 @@ def main():
     entries.append(entry)
     # Keep last 50 entries
     tokens_data["entries"] = entries[-50:]
+    tokens_data["freshness"] = freshness("update_tokens", CADENCE_S, tokens_data.get("freshness"), run_at)
     TOKENS_PATH.write_text(json.dumps(tokens_data, indent=2))
 
     # Update cost.json with computed Anthropic spend
@@ -87,6 +92,7 @@ def main():
     cost_data["spent_usd"] = total
     cost_data["remaining_usd"] = round(cap - total, 2)
     cost_data["updated_at"] = now
+    cost_data["freshness"] = freshness("update_tokens", CADENCE_S, cost_data.get("freshness"), run_at)
     COST_PATH.write_text(json.dumps(cost_data, indent=2))
 
     print(f"Tokens: {input_tokens} in ({cached_tokens} cached) / {output_tokens} out")